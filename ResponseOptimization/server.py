@@ -8,5 +8,8 @@ def index():
     return render_template('index.html')
 
 if __name__ == '__main__':
-    # Run the app. This is the server-side code.
-    app.run(host="0.0.0.0", port=5000)
+    # Serve through gunicorn via run_server.py instead of the Flask dev server
+    import os
+    import sys
+    run_server = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'run_server.py')
+    os.execv(sys.executable, [sys.executable, run_server, '--module', 'ResponseOptimization', *sys.argv[1:]])
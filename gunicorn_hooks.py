@@ -0,0 +1,16 @@
+"""
+Gunicorn server hooks used by run_server.py --pin-cpus
+Pins each worker to a single core so its socket buffers and app state stay
+in that core's caches instead of migrating with the scheduler.
+"""
+
+import os
+
+# Cores this launcher may use (respects taskset/cgroup limits)
+CPUS = sorted(os.sched_getaffinity(0))
+
+def post_fork(server, worker):
+    """Pin the new worker to one core, round-robin by spawn order"""
+    cpu = CPUS[worker.age % len(CPUS)]
+    os.sched_setaffinity(0, {cpu})
+    server.log.info("Worker %s pinned to CPU %s", worker.pid, cpu)
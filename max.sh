@@ -19,7 +19,7 @@ if [ "$EUID" -ne 0 ]; then
     exit 1
 fi
 
-echo "[1/7] Configuring system-wide limits..."
+echo "[1/8] Configuring system-wide limits..."
 
 # Backup original files
 cp /etc/security/limits.conf /etc/security/limits.conf.backup.$(date +%s) 2>/dev/null || true
@@ -42,7 +42,7 @@ root soft nproc unlimited
 root hard nproc unlimited
 EOF
 
-echo "[2/7] Configuring kernel parameters..."
+echo "[2/8] Configuring kernel parameters..."
 
 # Kernel network and performance tuning
 cat >> /etc/sysctl.conf << 'EOF'
@@ -95,18 +95,22 @@ vm.overcommit_memory = 1
 # Maximum shared memory
 kernel.shmmax = 68719476736
 kernel.shmall = 4294967296
+
+# Busy-poll the NIC queue from recv/poll before sleeping
+net.core.busy_poll = 50
+net.core.busy_read = 50
 EOF
 
 # Apply immediately
 sysctl -p
 
-echo "[3/7] Setting up connection tracking..."
+echo "[3/8] Setting up connection tracking..."
 
 # Load conntrack module and set max
 modprobe nf_conntrack
 echo 10485760 > /sys/module/nf_conntrack/parameters/hashsize 2>/dev/null || true
 
-echo "[4/7] Configuring systemd limits..."
+echo "[4/8] Configuring systemd limits..."
 
 # Configure systemd default limits
 mkdir -p /etc/systemd/system.conf.d/
@@ -127,7 +131,7 @@ DefaultLimitMEMLOCK=unlimited
 DefaultLimitSTACK=unlimited
 EOF
 
-echo "[5/7] Creating PAM configuration..."
+echo "[5/8] Creating PAM configuration..."
 
 # PAM limits
 cat > /etc/pam.d/common-session << 'EOF'
@@ -138,7 +142,7 @@ cat > /etc/pam.d/common-session-noninteractive << 'EOF'
 session required pam_limits.so
 EOF
 
-echo "[6/7] Disabling unnecessary services..."
+echo "[6/8] Disabling unnecessary services..."
 
 # Disable CPU frequency scaling (run at max speed)
 systemctl disable ondemand 2>/dev/null || true
@@ -154,11 +158,27 @@ cat > /etc/rc.local << 'EOF'
 for governor in /sys/devices/system/cpu/cpu*/cpufreq/scaling_governor; do
     echo performance > "$governor" 2>/dev/null || true
 done
+[ -x /usr/local/sbin/napi_defer.sh ] && /usr/local/sbin/napi_defer.sh
 exit 0
 EOF
 chmod +x /etc/rc.local
 
-echo "[7/7] Creating Flask server launcher..."
+echo "[7/8] Deferring NIC hard IRQs to NAPI polling..."
+
+# Keep NAPI polling instead of re-arming the IRQ after every packet burst
+# (kernel 5.10+). One script, run now and at boot by /etc/rc.local above
+cat > /usr/local/sbin/napi_defer.sh << 'EOF'
+#!/bin/bash
+for dev in /sys/class/net/*; do
+    [ -e "$dev/device" ] || continue   # physical NICs only
+    echo 200 > "$dev/gro_flush_timeout" 2>/dev/null || true
+    echo 50 > "$dev/napi_defer_hard_irqs" 2>/dev/null || true
+done
+EOF
+chmod +x /usr/local/sbin/napi_defer.sh
+/usr/local/sbin/napi_defer.sh
+
+echo "[8/8] Creating Flask server launcher..."
 
 cat > /tmp/flask_max_perf.sh << 'EOFSCRIPT'
 #!/bin/bash
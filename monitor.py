@@ -6,14 +6,17 @@ Usage: python3 monitor.py --interval 1 --output system_metrics.csv
        Press Ctrl+C to stop
 """
 
+import os
 import time
-import csv
 import argparse
 import signal
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+FLUSH_EVERY = 60  # samples buffered between flushes of the output file
+
 class SystemMonitor:
     def __init__(self, interval=1):
         self.interval = interval
@@ -21,6 +24,8 @@ class SystemMonitor:
         self.prev_net = None
         self.prev_disk = None
         self.prev_cpu = None
+        self._fds = {}  # /proc files stay open; each tick is lseek + read
+        self._row_template = None
         
         # Register signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -31,16 +36,31 @@ class SystemMonitor:
         self.running = False
     
     def read_file(self, path):
-        """Read file content safely"""
+        """Read file content safely as bytes, reusing a cached fd"""
         try:
-            with open(path, 'r') as f:
-                return f.read()
-        except:
-            return ""
+            fd = self._fds.get(path)
+            if fd is None:
+                fd = self._fds[path] = os.open(path, os.O_RDONLY)
+            os.lseek(fd, 0, os.SEEK_SET)
+            chunks = []
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+        except OSError:
+            return b""
+    
+    def close(self):
+        """Close the cached /proc fds"""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
     
     def get_cpu_stats(self):
         """Get CPU usage percentage"""
-        cpu_line = self.read_file('/proc/stat').split('\n')[0]
+        cpu_line = self.read_file('/proc/stat').split(b'\n', 1)[0]
         fields = cpu_line.split()[1:]
         current = [int(x) for x in fields[:8]]
         
@@ -59,18 +79,18 @@ class SystemMonitor:
     def get_memory_stats(self):
         """Get memory and buffer/cache stats"""
         mem_info = {}
-        for line in self.read_file('/proc/meminfo').split('\n'):
+        for line in self.read_file('/proc/meminfo').splitlines():
             if line:
-                parts = line.split(':')
+                parts = line.split(b':')
                 if len(parts) == 2:
                     key = parts[0].strip()
                     value = int(parts[1].strip().split()[0])  # KB
                     mem_info[key] = value
         
-        total = mem_info.get('MemTotal', 0)
-        available = mem_info.get('MemAvailable', 0)
-        buffers = mem_info.get('Buffers', 0)
-        cached = mem_info.get('Cached', 0)
+        total = mem_info.get(b'MemTotal', 0)
+        available = mem_info.get(b'MemAvailable', 0)
+        buffers = mem_info.get(b'Buffers', 0)
+        cached = mem_info.get(b'Cached', 0)
         
         used = total - available
         mem_usage_pct = 100.0 * used / total if total > 0 else 0.0
@@ -89,7 +109,7 @@ class SystemMonitor:
         disk_stats = {}
         
         # Read from /proc/diskstats
-        for line in self.read_file('/proc/diskstats').split('\n'):
+        for line in self.read_file('/proc/diskstats').splitlines():
             if not line:
                 continue
             parts = line.split()
@@ -98,7 +118,7 @@ class SystemMonitor:
             
             device = parts[2]
             # Focus on main disks (sda, nvme0n1, etc.), skip partitions
-            if device.startswith(('sd', 'nvme', 'vd', 'hd')) and not any(c.isdigit() for c in device[-1]):
+            if device.startswith((b'sd', b'nvme', b'vd', b'hd')) and not device[-1:].isdigit():
                 reads = int(parts[5])  # sectors read
                 writes = int(parts[9])  # sectors written
                 disk_stats[device] = {'reads': reads, 'writes': writes}
@@ -149,15 +169,15 @@ class SystemMonitor:
         """Get network traffic statistics"""
         net_stats = {}
         
-        for line in self.read_file('/proc/net/dev').split('\n')[2:]:
-            if not line or ':' not in line:
+        for line in self.read_file('/proc/net/dev').splitlines()[2:]:
+            if not line or b':' not in line:
                 continue
             
-            parts = line.split(':')
+            parts = line.split(b':')
             interface = parts[0].strip()
             
             # Skip loopback
-            if interface == 'lo':
+            if interface == b'lo':
                 continue
             
             stats = parts[1].split()
@@ -192,61 +212,34 @@ class SystemMonitor:
     
     def get_connection_stats(self):
         """Get TCP connection statistics - important for DDoS detection"""
-        states = {
-            'ESTABLISHED': 0,
-            'SYN_SENT': 0,
-            'SYN_RECV': 0,
-            'FIN_WAIT1': 0,
-            'FIN_WAIT2': 0,
-            'TIME_WAIT': 0,
-            'CLOSE': 0,
-            'CLOSE_WAIT': 0,
-            'LAST_ACK': 0,
-            'LISTEN': 0,
-            'CLOSING': 0
-        }
-        
         # State codes from /proc/net/tcp
         state_map = {
-            '01': 'ESTABLISHED',
-            '02': 'SYN_SENT',
-            '03': 'SYN_RECV',
-            '04': 'FIN_WAIT1',
-            '05': 'FIN_WAIT2',
-            '06': 'TIME_WAIT',
-            '07': 'CLOSE',
-            '08': 'CLOSE_WAIT',
-            '09': 'LAST_ACK',
-            '0A': 'LISTEN',
-            '0B': 'CLOSING'
+            b'01': 'ESTABLISHED',
+            b'02': 'SYN_SENT',
+            b'03': 'SYN_RECV',
+            b'04': 'FIN_WAIT1',
+            b'05': 'FIN_WAIT2',
+            b'06': 'TIME_WAIT',
+            b'07': 'CLOSE',
+            b'08': 'CLOSE_WAIT',
+            b'09': 'LAST_ACK',
+            b'0A': 'LISTEN',
+            b'0B': 'CLOSING'
         }
         
-        # Read TCP connections
-        for line in self.read_file('/proc/net/tcp').split('\n')[1:]:
-            if not line:
-                continue
-            parts = line.split()
-            if len(parts) < 4:
-                continue
-            
-            state_hex = parts[3]
-            state = state_map.get(state_hex, 'UNKNOWN')
-            if state in states:
-                states[state] += 1
-        
-        # Also check IPv6
-        for line in self.read_file('/proc/net/tcp6').split('\n')[1:]:
-            if not line:
-                continue
-            parts = line.split()
-            if len(parts) < 4:
-                continue
-            
-            state_hex = parts[3]
-            state = state_map.get(state_hex, 'UNKNOWN')
-            if state in states:
-                states[state] += 1
+        # The state column sits at a fixed offset after the "sl:" field:
+        # ": " + local (8+1+4 hex) + " " + remote (8+1+4) + " " for IPv4,
+        # 32-hex addresses for IPv6. Offsets are taken from the first ':'
+        # because the slot number widens past 9999 entries.
+        codes = Counter()
+        for path, offset in (('/proc/net/tcp', 30), ('/proc/net/tcp6', 78)):
+            codes.update(
+                line[i + offset:i + offset + 2]
+                for line in self.read_file(path).splitlines()[1:]
+                if (i := line.find(b':')) >= 0
+            )
         
+        states = {name: codes[code] for code, name in state_map.items()}
         total_connections = sum(states.values())
         
         return {
@@ -257,6 +250,15 @@ class SystemMonitor:
             'close_wait': states['CLOSE_WAIT']
         }
     
+    def build_row_template(self, metrics):
+        """Compile the fixed CSV schema into one %-format string (floats to 2 dp)"""
+        self._row_template = ','.join('%.2f' if isinstance(v, float) else '%s'
+                                      for v in metrics.values()) + '\n'
+    
+    def format_row(self, metrics):
+        """Encode one sample as a CSV line with a single C-level format call"""
+        return (self._row_template % tuple(metrics.values())).encode()
+    
     def collect_metrics(self):
         """Collect all metrics"""
         metrics = {
@@ -286,11 +288,12 @@ class SystemMonitor:
         # Get fieldnames from first real collection
         first_metrics = self.collect_metrics()
         fieldnames = list(first_metrics.keys())
+        self.build_row_template(first_metrics)
         
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerow(first_metrics)
+        # Rows are buffered and flushed once per FLUSH_EVERY samples
+        with open(output_file, 'wb', buffering=1 << 16) as f:
+            f.write(','.join(fieldnames).encode() + b'\n')
+            f.write(self.format_row(first_metrics))
             f.flush()
             
             count = 1
@@ -302,14 +305,16 @@ class SystemMonitor:
                 time.sleep(self.interval)
                 
                 metrics = self.collect_metrics()
-                writer.writerow(metrics)
-                f.flush()  # Ensure data is written immediately
+                f.write(self.format_row(metrics))
                 
                 count += 1
+                if count % FLUSH_EVERY == 0:
+                    f.flush()
                 print(f"[{count}] {metrics['timestamp']} | CPU: {metrics['cpu_usage_pct']}% | "
                       f"Mem: {metrics['mem_usage_pct']}% | "
                       f"Connections: {metrics['total_connections']}")
         
+        self.close()
         print(f"\n[+] Monitoring stopped. Collected {count} samples.")
         print(f"[+] Data saved to: {output_file}")
 
@@ -4,7 +4,7 @@ Production-grade launcher with Gunicorn + Gevent
 Maximum performance configuration
 
 Usage:
-    python3 run_server.py [--workers auto] [--port 5000]
+    python3 run_server.py [--module server] [--workers auto] [--port 5000]
 """
 
 import os
@@ -13,46 +13,102 @@ import multiprocessing
 import subprocess
 import argparse
 
-def get_optimal_workers():
+# App modules that can be served; each directory holds a server.py exposing `app`
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULES = {
+    'server': BASE_DIR,
+    'AdmissionControl': os.path.join(BASE_DIR, 'AdmissionControl'),
+    'ResponseOptimization': os.path.join(BASE_DIR, 'ResponseOptimization'),
+}
+
+# Per-worker concurrency when --threads is not given: gevent greenlets are
+# cheap, gthread uses real OS threads, sync serves one request at a time
+DEFAULT_CONCURRENCY = {
+    'gevent': 10000,
+    'gthread': 32,
+    'sync': 1,
+}
+
+def get_optimal_workers(mode):
     """Calculate optimal number of workers"""
     cpu_count = multiprocessing.cpu_count()
-    # Formula: (2 x CPU cores) + 1 for CPU-bound tasks
-    # Use more for I/O bound: 4-8 x CPU cores
-    return (cpu_count * 4) + 1
+    if mode == 'sync':
+        # Sync workers handle one connection each, so keep the old
+        # (4 x CPU cores) + 1 to get concurrency from processes
+        return (cpu_count * 4) + 1
+    # One worker per core: gevent/gthread workers are already I/O-concurrent,
+    # so more workers than cores only adds context switches
+    return cpu_count
+
+def _irq_owned_by(line, nic):
+    """True if a /proc/interrupts line names the device nic itself or one of
+    its queues (eth0, eth0-TxRx-1), not merely a name containing it (eth01)"""
+    devices = [token.rstrip(',') for token in line.split()[1:]]
+    return any(dev == nic or dev.startswith(nic + '-') for dev in devices)
+
+def pin_nic_irqs(nic):
+    """Spread the NIC's queue IRQs over the same cores the workers are pinned to"""
+    cpus = sorted(os.sched_getaffinity(0))
+    with open('/proc/interrupts') as f:
+        irqs = [line.split(':', 1)[0].strip() for line in f if _irq_owned_by(line, nic)]
+    
+    pinned = 0
+    for i, irq in enumerate(irqs):
+        try:
+            with open(f'/proc/irq/{irq}/smp_affinity_list', 'w') as f:
+                f.write(str(cpus[i % len(cpus)]))
+            pinned += 1
+        except OSError as e:
+            print(f"[!] Could not pin IRQ {irq}: {e}")
+    return pinned
 
 def main():
     parser = argparse.ArgumentParser(description='Launch high-performance Flask server')
+    parser.add_argument('--module', type=str, default='server',
+                       choices=list(MODULES),
+                       help='App to serve: server (root), AdmissionControl or ResponseOptimization')
     parser.add_argument('--workers', type=str, default='auto',
-                       help='Number of workers (default: auto = 4*CPU+1)')
+                       help='Number of workers (default: auto = CPU count)')
     parser.add_argument('--port', type=int, default=5000,
                        help='Port to listen on (default: 5000)')
     parser.add_argument('--host', type=str, default='0.0.0.0',
-                       help='Host to bind to (default: 0.0.0.0)')
-    parser.add_argument('--threads', type=int, default=1000,
-                       help='Threads per worker (default: 1000)')
+                       help='Host to bind to (default: 0.0.0.0; use [::] for dual-stack)')
+    parser.add_argument('--threads', type=int, default=None,
+                       help='Threads/connections per worker (default: 10000 for gevent, '
+                            '32 for gthread; ignored by sync)')
     parser.add_argument('--mode', type=str, default='gevent',
                        choices=['gevent', 'sync', 'gthread'],
                        help='Worker mode: gevent (best), sync, or gthread')
     parser.add_argument('--backlog', type=int, default=65535,
                        help='Maximum pending connections (default: 65535)')
+    parser.add_argument('--keep-alive', type=int, default=75,
+                       help='Seconds to hold idle keep-alive connections (default: 75)')
+    parser.add_argument('--pin-cpus', action='store_true',
+                       help='Pin worker i to core i (mod cores) via gunicorn_hooks.py')
+    parser.add_argument('--nic', type=str, default=None,
+                       help='With --pin-cpus, also pin this NIC\'s queue IRQs to the worker cores (root)')
     
     args = parser.parse_args()
     
     # Calculate workers
     if args.workers == 'auto':
-        workers = get_optimal_workers()
+        workers = get_optimal_workers(args.mode)
     else:
         workers = int(args.workers)
+    threads = args.threads if args.threads is not None else DEFAULT_CONCURRENCY[args.mode]
     
     print("=" * 60)
     print("HIGH-PERFORMANCE FLASK SERVER")
     print("=" * 60)
+    print(f"Module:           {args.module}")
     print(f"Workers:          {workers}")
-    print(f"Threads/Worker:   {args.threads}")
+    print(f"Threads/Worker:   {threads}")
     print(f"Worker Mode:      {args.mode}")
     print(f"Listen:           {args.host}:{args.port}")
     print(f"Backlog:          {args.backlog}")
+    print(f"Keep-Alive:       {args.keep_alive}s")
     print(f"CPU Cores:        {multiprocessing.cpu_count()}")
+    print(f"CPU Pinning:      {'on' if args.pin_cpus else 'off'}")
     print("=" * 60)
     print()
     
@@ -60,22 +116,34 @@ def main():
     cmd = [
         'gunicorn',
         'server:app',
+        '--chdir', MODULES[args.module],
         '--workers', str(workers),
         '--worker-class', args.mode,
-        '--worker-connections', str(args.threads),
         '--bind', f'{args.host}:{args.port}',
         '--backlog', str(args.backlog),
         '--timeout', '300',
-        '--keep-alive', '5',
+        '--keep-alive', str(args.keep_alive),
+        '--reuse-port',  # SO_REUSEPORT on the listening socket
         '--max-requests', '0',  # Never restart workers
         '--max-requests-jitter', '0',
-        '--preload',  # Preload app for faster worker spawning
         '--log-level', 'warning',
         '--access-logfile', '-',
         '--error-logfile', '-',
         '--enable-stdio-inheritance',
     ]
     
+    # Concurrency knob per worker class: gevent ignores --threads, gthread
+    # ignores --worker-connections, and sync uses neither
+    if args.mode == 'gthread':
+        cmd.extend(['--threads', str(threads)])
+    elif args.mode == 'gevent':
+        cmd.extend(['--worker-connections', str(threads)])
+    
+    if args.pin_cpus:
+        cmd.extend(['--config', os.path.join(BASE_DIR, 'gunicorn_hooks.py')])
+        if args.nic:
+            print(f"[+] Pinned {pin_nic_irqs(args.nic)} {args.nic} IRQs to worker cores")
+    
     # Additional optimizations for gevent
     if args.mode == 'gevent':
         cmd.extend([
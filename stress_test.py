@@ -8,32 +8,98 @@ Usage:
     python3 stress_test.py http://localhost:5000/matmul -n 10000 -c 100 --cooldown 1 --batch-size 1000
 
 Requirements:
-    pip3 install requests aiohttp
+    pip3 install requests aiohttp numpy numba uvloop
+    (numba and uvloop are optional: NumPy counting and the stock asyncio loop are used without them)
 """
 
 import asyncio
 import aiohttp
+import numpy as np
 import time
 import argparse
 import sys
-import statistics
 import json
 from datetime import datetime
 from collections import defaultdict
 import signal
 from dataclasses import dataclass, asdict
-from typing import List, Dict
-import csv
+from typing import Dict
 
-@dataclass
-class RequestResult:
-    """Single request result"""
-    success: bool
-    status_code: int
-    response_time: float
-    timestamp: float
-    error: str = ""
-    response_size: int = 0
+try:
+    import uvloop
+except ImportError:  # falls back to the stock asyncio event loop
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:  # the NumPy versions of the counting kernels are used
+    njit = None
+
+# Latency histogram: bucket k holds times in [edge[k-1], edge[k]) ms
+LATENCY_BUCKETS = ['<10ms', '10-50ms', '50-100ms', '100-200ms', '200-500ms',
+                   '500ms-1s', '1-2s', '2-5s', '>5s']
+LATENCY_EDGES_MS = np.array([10, 50, 100, 200, 500, 1000, 2000, 5000], dtype=np.float64)
+
+# HTTP status descriptions indexed directly by code (0 = connection failed)
+STATUS_DESCRIPTIONS = np.full(1000, "", dtype=object)
+for _code, _desc in {
+    0: "Connection Failed",
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    301: "Moved Permanently",
+    302: "Found",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout"
+}.items():
+    STATUS_DESCRIPTIONS[_code] = _desc
+
+# Detailed CSV: one %-template per row in csv.writer's layout (floats via repr, CRLF)
+CSV_HEADER = 'Request_ID,Success,Status_Code,Response_Time_ms,Timestamp,Response_Size_bytes,Error\r\n'
+CSV_ROW = '%d,%s,%d,%r,%r,%d,%s\r\n'
+
+def _csv_field(text: str) -> str:
+    """Quote a free-text field the way csv.writer's default QUOTE_MINIMAL does"""
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+if njit is not None:
+    @njit(cache=True)
+    def _bucketize(ms, edges):
+        """Count latencies per histogram bucket in a single compiled pass"""
+        counts = np.zeros(edges.size + 1, dtype=np.int64)
+        for v in ms:
+            k = 0
+            for e in edges:
+                k += 1 if v >= e else 0
+            counts[k] += 1
+        return counts
+
+    @njit(cache=True)
+    def _status_counts(codes):
+        """Count occurrences of each status code (0 = connection failed, up to 999)"""
+        counts = np.zeros(1000, dtype=np.int64)
+        for c in codes:
+            if 0 <= c < 1000:
+                counts[c] += 1
+        return counts
+else:
+    def _bucketize(ms, edges):
+        """Count latencies per histogram bucket (bucket k holds edges[k-1] <= v < edges[k])"""
+        return np.bincount(np.searchsorted(edges, ms, side='right'), minlength=edges.size + 1)
+
+    def _status_counts(codes):
+        """Count occurrences of each status code (0 = connection failed, up to 999)"""
+        codes = codes[(codes >= 0) & (codes < 1000)]
+        return np.bincount(codes.astype(np.intp), minlength=1000)
 
 @dataclass
 class TestStats:
@@ -70,9 +136,24 @@ class StressTester:
         self.keep_alive = keep_alive
         self.verify_ssl = verify_ssl
         
-        self.results: List[RequestResult] = []
+        # Results are stored column-wise, one slot per completed request in
+        # completion order; only failures carry a (rare) error string
+        self._n = 0
+        self._next_id = 0
+        self._success = np.zeros(total_requests, dtype=np.bool_)
+        self._status = np.zeros(total_requests, dtype=np.int16)
+        self._rt = np.zeros(total_requests, dtype=np.float32)  # seconds
+        self._ts = np.zeros(total_requests, dtype=np.float64)  # perf_counter() at send
+        self._size = np.zeros(total_requests, dtype=np.int64)
+        self._errors: Dict[int, str] = {}
+        
+        # Redraw the progress bar ~200 times per run rather than per request
+        self._progress_every = max(1, total_requests // 200)
+        # All timing uses the monotonic perf_counter(); wall-clock timestamps
+        # are derived from one time.time() reading taken when the run starts
         self.start_time = 0
         self.end_time = 0
+        self._wall_offset = 0.0
         self.running = True
         
         # Setup signal handler for graceful shutdown
@@ -83,9 +164,22 @@ class StressTester:
         print("\n\n[!] Interrupted! Generating report with collected data...\n")
         self.running = False
     
-    async def make_request(self, session: aiohttp.ClientSession, request_id: int) -> RequestResult:
-        """Make a single HTTP request"""
-        start = time.time()
+    def record(self, success: bool, status_code: int, response_time: float,
+               timestamp: float, response_size: int = 0, error: str = ""):
+        """Store one request result in the next free slot"""
+        i = self._n
+        self._success[i] = success
+        self._status[i] = status_code
+        self._rt[i] = response_time
+        self._ts[i] = timestamp
+        self._size[i] = response_size
+        if error:
+            self._errors[i] = error
+        self._n = i + 1
+    
+    async def make_request(self, session: aiohttp.ClientSession, request_id: int):
+        """Make a single HTTP request and record its result"""
+        start = time.perf_counter()
         
         try:
             kwargs = {
@@ -98,106 +192,55 @@ class StressTester:
                 kwargs['data'] = self.body
             
             async with session.request(self.method, self.url, **kwargs) as response:
-                # Read response to measure transfer time
-                content = await response.read()
-                response_time = time.time() - start
+                # Drain the body to measure transfer time; only its size is kept,
+                # so chunks are counted and dropped instead of joined into one bytes
+                size = 0
+                async for chunk in response.content.iter_any():
+                    size += len(chunk)
+                response_time = time.perf_counter() - start
                 
-                return RequestResult(
-                    success=True,
-                    status_code=response.status,
-                    response_time=response_time,
-                    timestamp=start,
-                    response_size=len(content)
-                )
+                self.record(True, response.status, response_time, start, size)
         
         except asyncio.TimeoutError:
-            return RequestResult(
-                success=False,
-                status_code=0,
-                response_time=time.time() - start,
-                timestamp=start,
-                error="Timeout"
-            )
+            self.record(False, 0, time.perf_counter() - start, start, error="Timeout")
         except aiohttp.ClientError as e:
-            return RequestResult(
-                success=False,
-                status_code=0,
-                response_time=time.time() - start,
-                timestamp=start,
-                error=f"ClientError: {str(e)}"
-            )
+            self.record(False, 0, time.perf_counter() - start, start, error=f"ClientError: {str(e)}")
         except Exception as e:
-            return RequestResult(
-                success=False,
-                status_code=0,
-                response_time=time.time() - start,
-                timestamp=start,
-                error=f"Exception: {str(e)}"
-            )
+            self.record(False, 0, time.perf_counter() - start, start, error=f"Exception: {str(e)}")
     
-    async def worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue, 
+    async def worker(self, session: aiohttp.ClientSession, end_idx: int,
                     worker_id: int, progress_callback):
-        """Worker coroutine that processes requests from queue"""
+        """Worker coroutine that claims request ids until the batch is exhausted"""
         while self.running:
+            # Claiming an id needs no lock: workers share one event-loop thread
+            request_id = self._next_id
+            if request_id >= end_idx:
+                return
+            self._next_id = request_id + 1
+            
             try:
-                request_id = await asyncio.wait_for(queue.get(), timeout=0.1)
-                
-                result = await self.make_request(session, request_id)
-                self.results.append(result)
+                await self.make_request(session, request_id)
                 
                 # Progress update
-                if progress_callback:
-                    progress_callback(len(self.results))
-                
-                queue.task_done()
+                done = self._n
+                if progress_callback and (done % self._progress_every == 0
+                                          or done == self.total_requests):
+                    progress_callback(done)
                 
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 print(f"[Worker {worker_id}] Error: {e}")
                 break
     
-    async def run_batch(self, start_idx: int, end_idx: int, progress_callback):
+    async def run_batch(self, session: aiohttp.ClientSession, start_idx: int, end_idx: int,
+                        progress_callback):
         """Run a batch of requests"""
-        batch_size = end_idx - start_idx
-        
-        # Configure connection pooling
-        connector = aiohttp.TCPConnector(
-            limit=self.concurrency * 2,  # Max connections
-            limit_per_host=self.concurrency * 2,
-            ttl_dns_cache=300,
-            force_close=not self.keep_alive
-        )
-        
-        # Create session with keep-alive
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers=self.headers
-        ) as session:
-            
-            # Create queue and add requests
-            queue = asyncio.Queue()
-            for i in range(start_idx, end_idx):
-                await queue.put(i)
-            
-            # Create workers
-            workers = [
-                asyncio.create_task(
-                    self.worker(session, queue, i, progress_callback)
-                )
-                for i in range(self.concurrency)
-            ]
-            
-            # Wait for queue to be processed
-            await queue.join()
-            
-            # Cancel workers
-            for w in workers:
-                w.cancel()
-            
-            await asyncio.gather(*workers, return_exceptions=True)
+        # Workers pull ids from start_idx up and return once end_idx is reached;
+        # a batch smaller than the concurrency only needs one worker per request
+        self._next_id = start_idx
+        await asyncio.gather(*(
+            self.worker(session, end_idx, i, progress_callback)
+            for i in range(min(self.concurrency, end_idx - start_idx))
+        ))
     
     def print_progress(self, completed: int):
         """Print progress bar"""
@@ -207,7 +250,7 @@ class StressTester:
         bar = '█' * filled + '░' * (bar_length - filled)
         
         # Calculate current RPS
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         current_rps = completed / elapsed if elapsed > 0 else 0
         
         sys.stdout.write(f'\r[{bar}] {progress:.1f}% | {completed}/{self.total_requests} | {current_rps:.0f} RPS')
@@ -230,79 +273,87 @@ class StressTester:
         print("=" * 70)
         print()
         
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+        self._wall_offset = time.time() - self.start_time
         
         # Process in batches if specified
         num_batches = (self.total_requests + self.batch_size - 1) // self.batch_size
         
-        for batch_num in range(num_batches):
-            if not self.running:
-                break
-            
-            start_idx = batch_num * self.batch_size
-            end_idx = min((batch_num + 1) * self.batch_size, self.total_requests)
-            
-            if num_batches > 1:
-                print(f"\n[Batch {batch_num + 1}/{num_batches}] Requests {start_idx}-{end_idx}")
-            
-            await self.run_batch(start_idx, end_idx, self.print_progress)
+        # One connection pool for the whole run: keep-alive connections and the
+        # resolved target address (cached for the run, never re-resolved) carry
+        # over between batches. One connection per concurrent worker is enough.
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            ttl_dns_cache=None,
+            force_close=not self.keep_alive
+        )
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=self.headers
+        ) as session:
             
-            # Cooldown between batches
-            if self.cooldown > 0 and batch_num < num_batches - 1 and self.running:
-                print(f"\n[Cooldown] Waiting {self.cooldown}s before next batch...")
-                await asyncio.sleep(self.cooldown)
+            for batch_num in range(num_batches):
+                if not self.running:
+                    break
+                
+                start_idx = batch_num * self.batch_size
+                end_idx = min((batch_num + 1) * self.batch_size, self.total_requests)
+                
+                if num_batches > 1:
+                    print(f"\n[Batch {batch_num + 1}/{num_batches}] Requests {start_idx}-{end_idx}")
+                
+                await self.run_batch(session, start_idx, end_idx, self.print_progress)
+                
+                # Cooldown between batches
+                if self.cooldown > 0 and batch_num < num_batches - 1 and self.running:
+                    print(f"\n[Cooldown] Waiting {self.cooldown}s before next batch...")
+                    await asyncio.sleep(self.cooldown)
         
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         print("\n")
     
     def calculate_stats(self) -> TestStats:
         """Calculate statistics from results"""
-        if not self.results:
+        n = self._n
+        if n == 0:
             return None
         
-        successful = [r for r in self.results if r.success]
-        failed = [r for r in self.results if not r.success]
+        success = self._success[:n]
+        successful = int(np.count_nonzero(success))
         
-        response_times = [r.response_time * 1000 for r in self.results]  # Convert to ms
-        response_times.sort()
+        response_times = self._rt[:n].astype(np.float64) * 1000  # Convert to ms
         
         # Status code distribution
-        status_codes = defaultdict(int)
-        for r in self.results:
-            status_codes[r.status_code] += 1
+        status_counts = _status_counts(self._status[:n])
+        status_codes = {int(c): int(status_counts[c]) for c in np.flatnonzero(status_counts)}
         
         # Error distribution
         errors = defaultdict(int)
-        for r in failed:
-            errors[r.error] += 1
-        
-        # Calculate percentiles
-        def percentile(data, p):
-            if not data:
-                return 0
-            k = (len(data) - 1) * p
-            f = int(k)
-            c = f + 1
-            if c >= len(data):
-                return data[-1]
-            return data[f] + (k - f) * (data[c] - data[f])
+        for error in self._errors.values():
+            errors[error] += 1
+        
+        # Median and tail percentiles from one partition (linear interpolation)
+        p50, p95, p99 = np.percentile(response_times, [50, 95, 99]).tolist()
         
         total_time = self.end_time - self.start_time
         
         return TestStats(
-            total_requests=len(self.results),
-            successful_requests=len(successful),
-            failed_requests=len(failed),
+            total_requests=n,
+            successful_requests=successful,
+            failed_requests=n - successful,
             total_time=total_time,
-            requests_per_second=len(self.results) / total_time if total_time > 0 else 0,
-            avg_response_time=statistics.mean(response_times) if response_times else 0,
-            min_response_time=min(response_times) if response_times else 0,
-            max_response_time=max(response_times) if response_times else 0,
-            median_response_time=statistics.median(response_times) if response_times else 0,
-            p95_response_time=percentile(response_times, 0.95),
-            p99_response_time=percentile(response_times, 0.99),
-            total_data_transferred=sum(r.response_size for r in successful),
-            status_codes=dict(status_codes),
+            requests_per_second=n / total_time if total_time > 0 else 0,
+            avg_response_time=float(np.mean(response_times)),
+            min_response_time=float(response_times.min()),
+            max_response_time=float(response_times.max()),
+            median_response_time=p50,
+            p95_response_time=p95,
+            p99_response_time=p99,
+            total_data_transferred=int(self._size[:n][success].sum()),
+            status_codes=status_codes,
             errors=dict(errors)
         )
     
@@ -353,24 +404,7 @@ class StressTester:
     
     def get_status_description(self, code: int) -> str:
         """Get HTTP status code description"""
-        descriptions = {
-            0: "Connection Failed",
-            200: "OK",
-            201: "Created",
-            204: "No Content",
-            301: "Moved Permanently",
-            302: "Found",
-            304: "Not Modified",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable",
-            504: "Gateway Timeout"
-        }
-        return descriptions.get(code, "")
+        return STATUS_DESCRIPTIONS[code] if 0 <= code < len(STATUS_DESCRIPTIONS) else ""
     
     def format_bytes(self, bytes_val: int) -> str:
         """Format bytes to human readable"""
@@ -382,21 +416,23 @@ class StressTester:
     
     def save_results_csv(self, filename: str):
         """Save detailed results to CSV"""
+        n = self._n
+        
+        # Columns are converted in bulk; only the (rare) error texts need quoting
+        errors = [""] * n
+        for i, error in self._errors.items():
+            errors[i] = _csv_field(error)
+        rows = zip(range(1, n + 1),
+                   self._success[:n].tolist(),
+                   self._status[:n].tolist(),
+                   np.round(self._rt[:n].astype(np.float64) * 1000, 2).tolist(),
+                   (self._ts[:n] + self._wall_offset).tolist(),
+                   self._size[:n].tolist(),
+                   errors)
+        
         with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Request_ID', 'Success', 'Status_Code', 'Response_Time_ms', 
-                           'Timestamp', 'Response_Size_bytes', 'Error'])
-            
-            for i, r in enumerate(self.results):
-                writer.writerow([
-                    i + 1,
-                    r.success,
-                    r.status_code,
-                    round(r.response_time * 1000, 2),
-                    r.timestamp,
-                    r.response_size,
-                    r.error
-                ])
+            f.write(CSV_HEADER)
+            f.writelines(CSV_ROW % row for row in rows)
         
         print(f"[+] Detailed results saved to: {filename}")
     
@@ -423,40 +459,9 @@ class StressTester:
     
     def generate_latency_distribution(self) -> Dict[str, int]:
         """Generate latency distribution histogram"""
-        buckets = {
-            '<10ms': 0,
-            '10-50ms': 0,
-            '50-100ms': 0,
-            '100-200ms': 0,
-            '200-500ms': 0,
-            '500ms-1s': 0,
-            '1-2s': 0,
-            '2-5s': 0,
-            '>5s': 0
-        }
-        
-        for r in self.results:
-            ms = r.response_time * 1000
-            if ms < 10:
-                buckets['<10ms'] += 1
-            elif ms < 50:
-                buckets['10-50ms'] += 1
-            elif ms < 100:
-                buckets['50-100ms'] += 1
-            elif ms < 200:
-                buckets['100-200ms'] += 1
-            elif ms < 500:
-                buckets['200-500ms'] += 1
-            elif ms < 1000:
-                buckets['500ms-1s'] += 1
-            elif ms < 2000:
-                buckets['1-2s'] += 1
-            elif ms < 5000:
-                buckets['2-5s'] += 1
-            else:
-                buckets['>5s'] += 1
-        
-        return buckets
+        ms = self._rt[:self._n].astype(np.float64) * 1000
+        counts = _bucketize(ms, LATENCY_EDGES_MS)
+        return dict(zip(LATENCY_BUCKETS, counts.tolist()))
     
     def print_latency_distribution(self):
         """Print latency distribution histogram"""
@@ -571,7 +576,9 @@ Examples:
 
 if __name__ == '__main__':
     try:
-        asyncio.run(main())
+        # libuv event loop when available: C-level socket callbacks instead of
+        # the Python selector loop
+        (uvloop.run if uvloop else asyncio.run)(main())
     except KeyboardInterrupt:
         print("\n[!] Test interrupted by user")
         sys.exit(0)
\ No newline at end of file
@@ -9,63 +9,203 @@ Usage:
 """
 
 import sys
-import csv
+import matplotlib
+matplotlib.use('Agg')  # PNG output only; never load a GUI toolkit
 import matplotlib.pyplot as plt
 import numpy as np
-from datetime import datetime
-from collections import Counter
+import pandas as pd
 import argparse
 
+from visualize import DEFAULT_DPI, downsample, render_parallel
+
+# CSV column -> data key for the numeric columns written by stress_test.py
+RESULT_COLUMNS = {
+    'Request_ID': 'request_ids',
+    'Status_Code': 'status_codes',
+    'Response_Time_ms': 'response_times',
+    'Timestamp': 'timestamps',
+    'Response_Size_bytes': 'response_sizes',
+}
+
+# Latency percentiles marked on the histogram and listed in the dashboard
+LATENCY_PERCENTILES = [50, 95, 99]
+
+# Histogram bin counts for the latency figure and the dashboard; both are
+# merged from one pass over LATENCY_BASE_BINS (a common multiple) bins
+LATENCY_BINS, DASHBOARD_BINS = 50, 30
+LATENCY_BASE_BINS = 150
+
+# Rows parsed per read_csv chunk: each chunk is reduced to typed arrays before
+# the next is read, so peak memory holds one chunk of raw text/objects
+RESULT_CHUNK_ROWS = 1_000_000
+
 def load_results(csv_file):
-    """Load stress test results from CSV"""
-    data = {
-        'request_ids': [],
-        'success': [],
-        'status_codes': [],
-        'response_times': [],
-        'timestamps': [],
-        'response_sizes': [],
-        'errors': []
+    """Load stress test results from CSV into one NumPy array per column"""
+    # Parsed by pandas' C reader (round-trip exact floats, like float());
+    # rows with a malformed number are dropped in bulk
+    chunks, skipped = [], 0
+    for df in pd.read_csv(csv_file, float_precision='round_trip', on_bad_lines='warn',
+                          dtype={'Success': str, 'Error': str}, chunksize=RESULT_CHUNK_ROWS):
+        parsed = df[list(RESULT_COLUMNS)].apply(pd.to_numeric, errors='coerce')
+        
+        bad = parsed.isna().any(axis=1)
+        if bad.any():
+            skipped += int(bad.sum())
+            parsed, df = parsed[~bad], df[~bad]
+        
+        chunk = {key: parsed[column].to_numpy() for column, key in RESULT_COLUMNS.items()}
+        # Narrowest exact types: ms latencies need no more than float32, status
+        # codes are 0-999; timestamps stay float64 (epoch seconds)
+        chunk['request_ids'] = chunk['request_ids'].astype(np.int32)
+        chunk['status_codes'] = chunk['status_codes'].astype(np.int16)
+        chunk['response_times'] = chunk['response_times'].astype(np.float32)
+        chunk['response_sizes'] = chunk['response_sizes'].astype(np.int32)
+        chunk['success'] = (df['Success'] == 'True').to_numpy()
+        chunk['errors'] = df['Error'].fillna('').to_numpy()
+        chunks.append(chunk)
+    
+    if skipped:
+        print(f"Warning: Skipping {skipped} malformed rows")
+    if len(chunks) == 1:
+        return chunks[0]
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+def build_context(data):
+    """Derived columns shared by every plot, computed once after loading"""
+    start_time = data['timestamps'].min()
+    success = data['success']
+    successful_times = data['response_times'][success]
+    # One selection pass for all reported percentiles
+    percentiles = (dict(zip(LATENCY_PERCENTILES,
+                            np.percentile(successful_times, LATENCY_PERCENTILES)))
+                   if len(successful_times) else {})
+    histograms = {}
+    if len(successful_times):
+        base_counts, base_edges = np.histogram(successful_times, bins=LATENCY_BASE_BINS)
+        for bins in (LATENCY_BINS, DASHBOARD_BINS):
+            step = LATENCY_BASE_BINS // bins
+            histograms[bins] = (base_counts.reshape(bins, step).sum(axis=1), base_edges[::step])
+    codes, first_seen, counts = np.unique(data['status_codes'], return_index=True,
+                                          return_counts=True)
+    return {
+        'start_time': start_time,
+        'duration': data['timestamps'].max() - start_time,
+        'relative_times': data['timestamps'] - start_time,
+        'successful_mask': success,
+        'success_count': int(np.count_nonzero(success)),
+        'successful_times': successful_times,
+        'percentiles': percentiles,
+        'latency_histograms': histograms,  # bins -> (counts, edges)
+        # Sorted distinct status codes, their counts, and each code's first row
+        'status_codes': codes,
+        'status_counts': counts,
+        'status_first_seen': first_seen,
     }
+
+def response_time_trend(relative_times, response_times):
+    """Moving average of every response time, downsampled for plotting"""
+    window_size = max(len(response_times) // 100, 10)
+    # Sliding-window sums from one cumulative sum: O(N) rather than convolve's O(N*window)
+    csum = np.concatenate(([0.0], np.cumsum(response_times, dtype=np.float64)))
+    moving_avg = (csum[window_size:] - csum[:-window_size]) / window_size
+    moving_avg_times = np.asarray(relative_times[window_size-1:])
+    moving_avg_times, moving_avg = downsample(moving_avg_times, moving_avg)
+    return moving_avg_times, moving_avg, window_size
+
+def throughput_buckets(ctx):
+    """Total and successful requests per second in ~1 s time buckets"""
+    duration = ctx['duration']
+    num_buckets = max(int(duration), 10)
+    bucket_size = duration / num_buckets
     
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                data['request_ids'].append(int(row['Request_ID']))
-                data['success'].append(row['Success'] == 'True')
-                data['status_codes'].append(int(row['Status_Code']))
-                data['response_times'].append(float(row['Response_Time_ms']))
-                data['timestamps'].append(float(row['Timestamp']))
-                data['response_sizes'].append(int(row['Response_Size_bytes']))
-                data['errors'].append(row['Error'])
-            except Exception as e:
-                print(f"Warning: Skipping row due to error: {e}")
-                continue
-    
-    return data
+    # Bucket index per request, then per-bucket totals in two bincount passes
+    if bucket_size > 0:
+        bucket_idx = np.minimum((ctx['relative_times'] / bucket_size).astype(np.int64),
+                                num_buckets - 1)
+    else:
+        bucket_idx = np.zeros(len(ctx['relative_times']), dtype=np.int64)
+    total = np.bincount(bucket_idx, minlength=num_buckets)
+    successful = np.bincount(bucket_idx, weights=ctx['successful_mask'], minlength=num_buckets)
+    
+    bucket_times = np.arange(num_buckets) * bucket_size + bucket_size / 2
+    if bucket_size > 0:
+        rps_values = total / bucket_size
+        success_rps = successful / bucket_size
+    else:
+        rps_values = success_rps = np.zeros(num_buckets)
+    return bucket_times, rps_values, success_rps
+
+def error_tally(errors):
+    """Distinct error messages and their counts, most frequent first"""
+    errors = errors[errors != '']
+    if len(errors) == 0:
+        return [], []
+    error_types, first_seen, error_counts = np.unique(errors, return_index=True,
+                                                      return_counts=True)
+    # Sort by count; ties keep the order errors first appeared in
+    order = np.lexsort((first_seen, -error_counts))
+    return error_types[order].tolist(), error_counts[order].tolist()
 
-def plot_response_times_over_time(data, output_prefix):
+def plot_jobs(data, ctx):
+    """(plot_fn, series) per figure, each series holding only what that plot draws.
+    
+    The per-row columns (and the object array of error strings) stay in
+    this process; workers receive the pre-binned series and the few
+    per-row arrays a scatter or box plot needs."""
+    total = len(data['response_times'])
+    successful = ctx['successful_mask']
+    failed = ~successful
+    successful_times = ctx['successful_times']
+    success_scatter = (ctx['relative_times'][successful], successful_times)
+    summary = {
+        'total': total,
+        'success_count': ctx['success_count'],
+        'failed_count': total - ctx['success_count'],
+    }
+    if len(successful_times):
+        summary.update(mean=np.mean(successful_times), median=np.median(successful_times),
+                       min=successful_times.min(), max=successful_times.max())
+    first_order = np.argsort(ctx['status_first_seen'])  # in order of first appearance
+    return [
+        (plot_response_times_over_time, {
+            'successful': success_scatter,
+            'failed': (ctx['relative_times'][failed], data['response_times'][failed]),
+            'trend': response_time_trend(ctx['relative_times'], data['response_times']),
+        }),
+        (plot_throughput, {'buckets': throughput_buckets(ctx)}),
+        (plot_latency_distribution, {
+            'successful_times': successful_times,
+            'histogram': ctx['latency_histograms'].get(LATENCY_BINS),
+            'percentiles': ctx['percentiles'],
+        }),
+        (plot_status_codes, dict(summary,
+                                 codes=ctx['status_codes'].tolist(),
+                                 counts=ctx['status_counts'].tolist())),
+        (plot_errors, {'errors': error_tally(data['errors'])}),
+        (plot_dashboard, dict(summary,
+                              successful=success_scatter,
+                              histogram=ctx['latency_histograms'].get(DASHBOARD_BINS),
+                              codes=ctx['status_codes'][first_order].tolist(),
+                              counts=ctx['status_counts'][first_order].tolist(),
+                              percentiles=ctx['percentiles'],
+                              duration=ctx['duration'])),
+    ]
+
+def plot_response_times_over_time(series, output_prefix, dpi=DEFAULT_DPI):
     """Plot response times over the test duration"""
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10))
     fig.suptitle('Response Time Analysis', fontsize=16, fontweight='bold')
     
-    # Calculate relative time from start
-    start_time = min(data['timestamps'])
-    relative_times = [(t - start_time) for t in data['timestamps']]
-    
     # Plot 1: Response times scatter
-    successful = [i for i, s in enumerate(data['success']) if s]
-    failed = [i for i, s in enumerate(data['success']) if not s]
+    successful_x, successful_y = series['successful']
+    failed_x, failed_y = series['failed']
     
-    if successful:
-        ax1.scatter([relative_times[i] for i in successful],
-                   [data['response_times'][i] for i in successful],
+    if len(successful_x):
+        ax1.scatter(successful_x, successful_y,
                    c='#2ecc71', alpha=0.3, s=1, label='Successful')
     
-    if failed:
-        ax1.scatter([relative_times[i] for i in failed],
-                   [data['response_times'][i] for i in failed],
+    if len(failed_x):
+        ax1.scatter(failed_x, failed_y,
                    c='#e74c3c', alpha=0.6, s=5, label='Failed')
     
     ax1.set_xlabel('Time (seconds)', fontsize=12)
@@ -75,11 +215,7 @@ def plot_response_times_over_time(data, output_prefix):
     ax1.grid(True, alpha=0.3)
     
     # Plot 2: Moving average (smoothed)
-    window_size = max(len(data['response_times']) // 100, 10)
-    moving_avg = np.convolve(data['response_times'], 
-                            np.ones(window_size)/window_size, 
-                            mode='valid')
-    moving_avg_times = relative_times[window_size-1:]
+    moving_avg_times, moving_avg, window_size = series['trend']
     
     ax2.plot(moving_avg_times, moving_avg, color='#3498db', linewidth=2, 
             label=f'Moving Average (window={window_size})')
@@ -91,33 +227,17 @@ def plot_response_times_over_time(data, output_prefix):
     ax2.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(f'{output_prefix}_response_times.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_response_times.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_response_times.png")
     plt.close()
 
-def plot_throughput(data, output_prefix):
+def plot_throughput(series, output_prefix, dpi=DEFAULT_DPI):
     """Plot requests per second over time"""
     fig, ax = plt.subplots(figsize=(16, 6))
     fig.suptitle('Throughput Analysis', fontsize=16, fontweight='bold')
     
-    # Calculate RPS in time buckets
-    start_time = min(data['timestamps'])
-    duration = max(data['timestamps']) - start_time
-    num_buckets = max(int(duration), 10)
-    bucket_size = duration / num_buckets
-    
-    buckets = [[] for _ in range(num_buckets)]
-    for i, ts in enumerate(data['timestamps']):
-        bucket_idx = min(int((ts - start_time) / bucket_size), num_buckets - 1)
-        buckets[bucket_idx].append(i)
-    
-    bucket_times = [(i * bucket_size) + (bucket_size / 2) for i in range(num_buckets)]
-    rps_values = [len(bucket) / bucket_size if bucket_size > 0 else 0 for bucket in buckets]
-    success_rps = []
-    
-    for bucket in buckets:
-        successful = sum(1 for idx in bucket if data['success'][idx])
-        success_rps.append(successful / bucket_size if bucket_size > 0 else 0)
+    # RPS in time buckets
+    bucket_times, rps_values, success_rps = series['buckets']
     
     # Plot
     ax.plot(bucket_times, rps_values, color='#3498db', linewidth=2, 
@@ -139,35 +259,34 @@ def plot_throughput(data, output_prefix):
     ax.legend(loc='best', fontsize=10)
     
     plt.tight_layout()
-    plt.savefig(f'{output_prefix}_throughput.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_throughput.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_throughput.png")
     plt.close()
 
-def plot_latency_distribution(data, output_prefix):
+def plot_latency_distribution(series, output_prefix, dpi=DEFAULT_DPI):
     """Plot latency histogram and percentiles"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     fig.suptitle('Latency Distribution', fontsize=16, fontweight='bold')
     
-    successful_times = [data['response_times'][i] for i in range(len(data['response_times'])) 
-                       if data['success'][i]]
+    successful_times = series['successful_times']
     
-    if not successful_times:
+    if len(successful_times) == 0:
         print("[!] No successful requests to plot")
         return
     
     # Histogram
-    ax1.hist(successful_times, bins=50, color='#3498db', alpha=0.7, edgecolor='black')
+    counts, edges = series['histogram']
+    ax1.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='#3498db', alpha=0.7, edgecolor='black')
     ax1.set_xlabel('Response Time (ms)', fontsize=12)
     ax1.set_ylabel('Frequency', fontsize=12)
     ax1.set_title('Response Time Histogram', fontweight='bold')
     ax1.grid(True, alpha=0.3, axis='y')
     
     # Add percentile lines
-    percentiles = [50, 95, 99]
     colors = ['#2ecc71', '#f39c12', '#e74c3c']
     
-    for p, color in zip(percentiles, colors):
-        value = np.percentile(successful_times, p)
+    for (p, value), color in zip(series['percentiles'].items(), colors):
         ax1.axvline(x=value, color=color, linestyle='--', linewidth=2, 
                    label=f'p{p}: {value:.1f}ms')
     ax1.legend()
@@ -195,19 +314,18 @@ def plot_latency_distribution(data, output_prefix):
             fontsize=10)
     
     plt.tight_layout()
-    plt.savefig(f'{output_prefix}_latency_distribution.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_latency_distribution.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_latency_distribution.png")
     plt.close()
 
-def plot_status_codes(data, output_prefix):
+def plot_status_codes(series, output_prefix, dpi=DEFAULT_DPI):
     """Plot status code distribution"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     fig.suptitle('Status Code Analysis', fontsize=16, fontweight='bold')
     
     # Count status codes
-    status_counter = Counter(data['status_codes'])
-    codes = sorted(status_counter.keys())
-    counts = [status_counter[code] for code in codes]
+    codes = series['codes']
+    counts = series['counts']
     
     # Color mapping
     colors_map = {
@@ -239,8 +357,8 @@ def plot_status_codes(data, output_prefix):
                 ha='center', va='bottom', fontsize=9)
     
     # Pie chart
-    success_count = sum(1 for s in data['success'] if s)
-    failed_count = len(data['success']) - success_count
+    success_count = series['success_count']
+    failed_count = series['failed_count']
     
     sizes = [success_count, failed_count]
     labels = ['Successful', 'Failed']
@@ -252,29 +370,21 @@ def plot_status_codes(data, output_prefix):
     ax2.set_title('Success vs Failed Requests', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig(f'{output_prefix}_status_codes.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_status_codes.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_status_codes.png")
     plt.close()
 
-def plot_errors(data, output_prefix):
+def plot_errors(series, output_prefix, dpi=DEFAULT_DPI):
     """Plot error distribution if any errors exist"""
-    errors = [e for e in data['errors'] if e]
+    error_types, error_counts = series['errors']
     
-    if not errors:
+    if len(error_types) == 0:
         print("[*] No errors to plot")
         return
     
     fig, ax = plt.subplots(figsize=(14, 8))
     fig.suptitle('Error Analysis', fontsize=16, fontweight='bold')
     
-    error_counter = Counter(errors)
-    error_types = list(error_counter.keys())
-    error_counts = list(error_counter.values())
-    
-    # Sort by count
-    sorted_pairs = sorted(zip(error_types, error_counts), key=lambda x: x[1], reverse=True)
-    error_types, error_counts = zip(*sorted_pairs) if sorted_pairs else ([], [])
-    
     # Horizontal bar chart
     y_pos = range(len(error_types))
     bars = ax.barh(y_pos, error_counts, color='#e74c3c', alpha=0.7, edgecolor='black')
@@ -293,30 +403,22 @@ def plot_errors(data, output_prefix):
                ha='left', va='center', fontsize=9)
     
     plt.tight_layout()
-    plt.savefig(f'{output_prefix}_errors.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_errors.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_errors.png")
     plt.close()
 
-def plot_dashboard(data, output_prefix):
+def plot_dashboard(series, output_prefix, dpi=DEFAULT_DPI):
     """Create all-in-one dashboard"""
     fig = plt.figure(figsize=(20, 12))
     fig.suptitle('Stress Test Dashboard', fontsize=18, fontweight='bold')
     
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
-    # Calculate stats
-    successful_times = [data['response_times'][i] for i in range(len(data['response_times'])) 
-                       if data['success'][i]]
-    
-    start_time = min(data['timestamps'])
-    relative_times = [(t - start_time) for t in data['timestamps']]
-    
     # 1. Response times over time
     ax1 = fig.add_subplot(gs[0, :])
-    successful_idx = [i for i, s in enumerate(data['success']) if s]
-    if successful_idx:
-        ax1.scatter([relative_times[i] for i in successful_idx],
-                   [data['response_times'][i] for i in successful_idx],
+    successful_x, successful_y = series['successful']
+    if len(successful_x):
+        ax1.scatter(successful_x, successful_y,
                    c='#2ecc71', alpha=0.2, s=1)
     ax1.set_ylabel('Response Time (ms)')
     ax1.set_xlabel('Time (s)')
@@ -325,8 +427,10 @@ def plot_dashboard(data, output_prefix):
     
     # 2. Latency histogram
     ax2 = fig.add_subplot(gs[1, 0])
-    if successful_times:
-        ax2.hist(successful_times, bins=30, color='#3498db', alpha=0.7, edgecolor='black')
+    if series['histogram'] is not None:
+        counts, edges = series['histogram']
+        ax2.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                color='#3498db', alpha=0.7, edgecolor='black')
     ax2.set_xlabel('Response Time (ms)')
     ax2.set_ylabel('Frequency')
     ax2.set_title('Latency Distribution')
@@ -334,9 +438,8 @@ def plot_dashboard(data, output_prefix):
     
     # 3. Status codes
     ax3 = fig.add_subplot(gs[1, 1])
-    status_counter = Counter(data['status_codes'])
-    codes = list(status_counter.keys())
-    counts = list(status_counter.values())
+    codes = series['codes']  # in order of first appearance
+    counts = series['counts']
     ax3.bar(range(len(codes)), counts, color='#2ecc71', alpha=0.7)
     ax3.set_xticks(range(len(codes)))
     ax3.set_xticklabels([str(c) for c in codes])
@@ -346,8 +449,8 @@ def plot_dashboard(data, output_prefix):
     
     # 4. Success vs Failure
     ax4 = fig.add_subplot(gs[1, 2])
-    success_count = sum(data['success'])
-    failed_count = len(data['success']) - success_count
+    success_count = series['success_count']
+    failed_count = series['failed_count']
     ax4.pie([success_count, failed_count], labels=['Success', 'Failed'],
            colors=['#2ecc71', '#e74c3c'], autopct='%1.1f%%', startangle=90)
     ax4.set_title('Success Rate')
@@ -356,24 +459,25 @@ def plot_dashboard(data, output_prefix):
     ax5 = fig.add_subplot(gs[2, :])
     ax5.axis('off')
     
-    if successful_times:
+    total = series['total']
+    if success_count > 0:
         stats_text = f"""
     SUMMARY STATISTICS
     {'='*60}
-    Total Requests:        {len(data['response_times']):,}
-    Successful:            {success_count:,} ({success_count/len(data['response_times'])*100:.1f}%)
-    Failed:                {failed_count:,} ({failed_count/len(data['response_times'])*100:.1f}%)
+    Total Requests:        {total:,}
+    Successful:            {success_count:,} ({success_count/total*100:.1f}%)
+    Failed:                {failed_count:,} ({failed_count/total*100:.1f}%)
     
     Response Time (ms):
-        Average:           {np.mean(successful_times):.2f}
-        Median:            {np.median(successful_times):.2f}
-        Min:               {np.min(successful_times):.2f}
-        Max:               {np.max(successful_times):.2f}
-        95th Percentile:   {np.percentile(successful_times, 95):.2f}
-        99th Percentile:   {np.percentile(successful_times, 99):.2f}
-    
-    Test Duration:         {max(relative_times):.2f} seconds
-    Requests per Second:   {len(data['response_times']) / max(relative_times):.2f}
+        Average:           {series['mean']:.2f}
+        Median:            {series['median']:.2f}
+        Min:               {series['min']:.2f}
+        Max:               {series['max']:.2f}
+        95th Percentile:   {series['percentiles'][95]:.2f}
+        99th Percentile:   {series['percentiles'][99]:.2f}
+    
+    Test Duration:         {series['duration']:.2f} seconds
+    Requests per Second:   {total / series['duration']:.2f}
         """
     else:
         stats_text = "No successful requests to analyze"
@@ -381,7 +485,7 @@ def plot_dashboard(data, output_prefix):
     ax5.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
             verticalalignment='center')
     
-    plt.savefig(f'{output_prefix}_dashboard.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{output_prefix}_dashboard.png', dpi=dpi, bbox_inches='tight')
     print(f"[+] Saved: {output_prefix}_dashboard.png")
     plt.close()
 
@@ -390,13 +494,15 @@ def main():
     parser.add_argument('csv_file', help='Input CSV file from stress_test.py')
     parser.add_argument('--output', '-o', default='stress_test',
                        help='Output prefix for graph files (default: stress_test)')
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI,
+                       help=f'Resolution of the saved graphs (default: {DEFAULT_DPI})')
     
     args = parser.parse_args()
     
     print(f"[+] Loading data from: {args.csv_file}")
     data = load_results(args.csv_file)
     
-    if not data['request_ids']:
+    if len(data['request_ids']) == 0:
         print("[!] Error: No valid data found in CSV file")
         return
     
@@ -404,13 +510,11 @@ def main():
     print(f"[+] Generating visualizations...")
     print()
     
-    # Generate all plots
-    plot_response_times_over_time(data, args.output)
-    plot_throughput(data, args.output)
-    plot_latency_distribution(data, args.output)
-    plot_status_codes(data, args.output)
-    plot_errors(data, args.output)
-    plot_dashboard(data, args.output)
+    # Generate all plots from one shared pass over the data
+    # (one figure per worker process, sent only its own series)
+    ctx = build_context(data)
+    render_parallel([(fn, series, args.output, args.dpi)
+                     for fn, series in plot_jobs(data, ctx)])
     
     print()
     print("[+] Done! Generated visualizations:")